@@ -25,21 +25,61 @@ def calculate_metrics(equity_curve: pd.Series, trades: pd.DataFrame,
     # Max drawdown
     metrics['max_drawdown'] = max_drawdown(equity_curve)
     
-    # Trade statistics
-    if len(trades) > 0:
-        metrics['win_rate'] = win_rate(trades)
-        metrics['profit_factor'] = profit_factor(trades)
-        metrics['avg_trade_return'] = avg_trade_return(trades)
-        metrics['avg_trade_duration'] = avg_trade_duration(trades)
-    else:
-        metrics['win_rate'] = 0
-        metrics['profit_factor'] = 0
-        metrics['avg_trade_return'] = 0
-        metrics['avg_trade_duration'] = pd.Timedelta(0)
-    
+    # Trade statistics (single pass over the trade log)
+    metrics.update(_trade_stats(trades))
+
     return metrics
 
 
+def _trade_stats(trades: pd.DataFrame) -> Dict[str, float]:
+    """Compute all round-trip trade statistics in one pass"""
+    stats = {
+        'win_rate': 0,
+        'profit_factor': 0,
+        'avg_trade_return': 0,
+        'avg_trade_duration': pd.Timedelta(0)
+    }
+    if len(trades) < 2:
+        return stats
+
+    side = trades['side'].to_numpy()
+    price = trades['price'].to_numpy(dtype=np.float64)
+    size = trades['size'].to_numpy(dtype=np.float64)
+    # int64 nanoseconds: duration math stays in plain integers
+    ts_ns = trades['timestamp'].to_numpy().astype('datetime64[ns]').view('int64')
+
+    # Consecutive trades on opposite sides form a round trip
+    mask = side[1:] != side[:-1]
+    if not mask.any():
+        stats['profit_factor'] = float('inf')
+        return stats
+
+    sell = side[1:] == 'sell'
+    direction = np.where(sell, 1.0, -1.0)
+    price_diff = price[1:] - price[:-1]
+
+    pnl = (direction * price_diff * size[1:])[mask]
+    # Entry price is the previous fill for sells, the current fill for buys
+    returns = np.where(
+        sell,
+        price_diff / price[:-1],
+        -price_diff / price[1:]
+    )[mask]
+    durations = np.diff(ts_ns)[mask]
+
+    # Win rate uses per-unit P&L, consistent with win_rate()
+    unit_pnl = (direction * price_diff)[mask]
+    stats['win_rate'] = float((unit_pnl > 0).sum() / len(unit_pnl))
+
+    gross_profit = pnl[pnl > 0].sum()
+    gross_loss = -pnl[pnl <= 0].sum()
+    stats['profit_factor'] = gross_profit / gross_loss if gross_loss > 0 else float('inf')
+
+    stats['avg_trade_return'] = float(returns.mean())
+    stats['avg_trade_duration'] = pd.Timedelta(int(durations.mean()), unit='ns')
+    return stats
+
+
 def sharpe_ratio(returns: pd.Series, periods_per_year: int = 252) -> float:
     """Calculate annualized Sharpe ratio"""
     if len(returns) < 2:
@@ -58,59 +98,46 @@ def sharpe_ratio(returns: pd.Series, periods_per_year: int = 252) -> float:
 
 def max_drawdown(equity_curve: pd.Series) -> float:
     """Calculate maximum drawdown"""
-    cumulative = (1 + equity_curve.pct_change()).cumprod()
-    running_max = cumulative.expanding().max()
-    drawdown = (cumulative - running_max) / running_max
-    return drawdown.min()
+    arr = equity_curve.to_numpy(dtype=np.float64)
+    if len(arr) == 0:
+        return 0.0
+    peak = np.maximum.accumulate(arr)
+    drawdown = (arr - peak) / peak
+    return float(drawdown.min())
 
 
 def win_rate(trades: pd.DataFrame) -> float:
     """Calculate win rate"""
-    if len(trades) == 0:
+    if len(trades) < 2:
         return 0
-    
-    # Group by symbol to match buy/sell pairs
-    wins = 0
-    total = 0
-    
-    # Simple approach - calculate P&L for each trade
-    for i, trade in trades.iterrows():
-        if i > 0:  # Skip first trade
-            if trade['side'] != trades.iloc[i-1]['side']:  # Opposite side
-                # Calculate P&L
-                if trade['side'] == 'sell':
-                    pnl = trade['price'] - trades.iloc[i-1]['price']
-                else:
-                    pnl = trades.iloc[i-1]['price'] - trade['price']
-                
-                if pnl > 0:
-                    wins += 1
-                total += 1
-    
-    return wins / total if total > 0 else 0
+
+    side = trades['side'].to_numpy()
+    price = trades['price'].to_numpy(dtype=np.float64)
+
+    # Consecutive trades on opposite sides form a round trip
+    mask = side[1:] != side[:-1]
+    direction = np.where(side[1:] == 'sell', 1.0, -1.0)
+    pnl = (direction * (price[1:] - price[:-1]))[mask]
+
+    return float((pnl > 0).sum() / len(pnl)) if len(pnl) > 0 else 0
 
 
 def profit_factor(trades: pd.DataFrame) -> float:
     """Calculate profit factor"""
     if len(trades) < 2:
         return 0
-    
-    gross_profit = 0
-    gross_loss = 0
-    
-    # Calculate P&L for each trade pair
-    for i in range(1, len(trades)):
-        if trades.iloc[i]['side'] != trades.iloc[i-1]['side']:
-            if trades.iloc[i]['side'] == 'sell':
-                pnl = (trades.iloc[i]['price'] - trades.iloc[i-1]['price']) * trades.iloc[i]['size']
-            else:
-                pnl = (trades.iloc[i-1]['price'] - trades.iloc[i]['price']) * trades.iloc[i]['size']
-            
-            if pnl > 0:
-                gross_profit += pnl
-            else:
-                gross_loss += abs(pnl)
-    
+
+    side = trades['side'].to_numpy()
+    price = trades['price'].to_numpy(dtype=np.float64)
+    size = trades['size'].to_numpy(dtype=np.float64)
+
+    mask = side[1:] != side[:-1]
+    direction = np.where(side[1:] == 'sell', 1.0, -1.0)
+    pnl = (direction * (price[1:] - price[:-1]) * size[1:])[mask]
+
+    gross_profit = pnl[pnl > 0].sum()
+    gross_loss = -pnl[pnl <= 0].sum()
+
     return gross_profit / gross_loss if gross_loss > 0 else float('inf')
 
 
@@ -118,28 +145,33 @@ def avg_trade_return(trades: pd.DataFrame) -> float:
     """Calculate average trade return"""
     if len(trades) < 2:
         return 0
-    
-    returns = []
-    for i in range(1, len(trades)):
-        if trades.iloc[i]['side'] != trades.iloc[i-1]['side']:
-            if trades.iloc[i]['side'] == 'sell':
-                ret = (trades.iloc[i]['price'] - trades.iloc[i-1]['price']) / trades.iloc[i-1]['price']
-            else:
-                ret = (trades.iloc[i-1]['price'] - trades.iloc[i]['price']) / trades.iloc[i]['price']
-            returns.append(ret)
-    
-    return np.mean(returns) if returns else 0
+
+    side = trades['side'].to_numpy()
+    price = trades['price'].to_numpy(dtype=np.float64)
+
+    mask = side[1:] != side[:-1]
+    sell = side[1:] == 'sell'
+    # Entry price is the previous fill for sells, the current fill for buys
+    returns = np.where(
+        sell,
+        (price[1:] - price[:-1]) / price[:-1],
+        (price[:-1] - price[1:]) / price[1:]
+    )[mask]
+
+    return float(returns.mean()) if len(returns) > 0 else 0
 
 
 def avg_trade_duration(trades: pd.DataFrame) -> pd.Timedelta:
     """Calculate average trade duration"""
     if len(trades) < 2:
         return pd.Timedelta(0)
-    
-    durations = []
-    for i in range(1, len(trades)):
-        if trades.iloc[i]['side'] != trades.iloc[i-1]['side']:
-            duration = trades.iloc[i]['timestamp'] - trades.iloc[i-1]['timestamp']
-            durations.append(duration)
-    
-    return pd.Timedelta(np.mean(durations)) if durations else pd.Timedelta(0)
+
+    side = trades['side'].to_numpy()
+    ts_ns = trades['timestamp'].to_numpy().astype('datetime64[ns]').view('int64')
+
+    mask = side[1:] != side[:-1]
+    durations = np.diff(ts_ns)[mask]
+
+    if len(durations) == 0:
+        return pd.Timedelta(0)
+    return pd.Timedelta(int(durations.mean()), unit='ns')
@@ -50,14 +50,15 @@ def plot_results(results):
         )
     
     # 3. Drawdown subplot
-    cumulative = (1 + results.equity_curve.pct_change()).cumprod()
-    running_max = cumulative.expanding().max()
-    drawdown = (cumulative - running_max) / running_max
-    
+    # Equity relative to its running peak; same curve the old
+    # pct_change/cumprod/expanding chain produced, in one pass
+    eq = results.equity_curve.to_numpy(dtype=np.float64)
+    drawdown = eq / np.maximum.accumulate(eq) - 1.0
+
     fig.add_trace(
         go.Scatter(
-            x=drawdown.index,
-            y=drawdown.values * 100,  # Convert to percentage
+            x=results.equity_curve.index,
+            y=drawdown * 100,  # Convert to percentage
             fill='tozeroy',
             name='Drawdown',
             line=dict(color='red', width=1),
@@ -68,16 +69,20 @@ def plot_results(results):
     
     # 4. Trade returns distribution
     if len(results.trades) > 1:
-        trade_returns = []
-        for i in range(1, len(results.trades)):
-            if results.trades.iloc[i]['side'] != results.trades.iloc[i-1]['side']:
-                if results.trades.iloc[i]['side'] == 'sell':
-                    ret = (results.trades.iloc[i]['price'] - results.trades.iloc[i-1]['price']) / results.trades.iloc[i-1]['price']
-                else:
-                    ret = (results.trades.iloc[i-1]['price'] - results.trades.iloc[i]['price']) / results.trades.iloc[i]['price']
-                trade_returns.append(ret * 100)  # Convert to percentage
-        
-        if trade_returns:
+        side = results.trades['side'].to_numpy()
+        price = results.trades['price'].to_numpy(dtype=np.float64)
+
+        # Consecutive trades on opposite sides form a round trip
+        mask = side[1:] != side[:-1]
+        sell = side[1:] == 'sell'
+        returns = np.where(
+            sell,
+            (price[1:] - price[:-1]) / price[:-1],
+            (price[:-1] - price[1:]) / price[1:]
+        )[mask]
+        trade_returns = returns * 100  # Convert to percentage
+
+        if len(trade_returns) > 0:
             fig.add_trace(
                 go.Histogram(
                     x=trade_returns,
@@ -112,32 +117,16 @@ def _calculate_position_series(trades, timestamps):
     """Calculate position size over time from trades"""
     if len(trades) == 0:
         return pd.Series()
-    
-    # Initialize position tracking
-    positions = {}
-    position_history = []
-    
-    # Create a series with all timestamps
-    position_series = pd.Series(index=timestamps, data=0.0)
-    
-    # Track position changes from trades
-    for _, trade in trades.iterrows():
-        symbol = trade['symbol']
-        
-        if symbol not in positions:
-            positions[symbol] = 0
-        
-        # Update position
-        if trade['side'] == 'buy':
-            positions[symbol] += trade['size']
-        else:
-            positions[symbol] -= trade['size']
-        
-        # Record total position at this timestamp
-        total_position = sum(positions.values())
-        position_series.loc[trade['timestamp']:] = total_position
-    
-    return position_series
+
+    # Signed size deltas, summed per trade timestamp, then a single
+    # cumsum + forward-fill instead of one slice assignment per trade
+    deltas = np.where(
+        trades['side'].to_numpy() == 'buy', 1.0, -1.0
+    ) * trades['size'].to_numpy(dtype=np.float64)
+
+    per_timestamp = pd.Series(deltas).groupby(trades['timestamp'].to_numpy()).sum()
+    cumulative = per_timestamp.cumsum()
+    return cumulative.reindex(timestamps, method='ffill').fillna(0.0)
 
 
 def plot_equity(equity_curve: pd.Series):
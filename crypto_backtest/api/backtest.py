@@ -59,7 +59,8 @@ def run_backtest(
     slippage_bps: float = 10,
     position_limits: Optional[Dict] = None,
     risk_limits: Optional[Dict] = None,
-    verbose: bool = True
+    verbose: bool = True,
+    safe_mode: bool = True
 ) -> BacktestResults:
     """
     Run backtest on strategy
@@ -75,6 +76,8 @@ def run_backtest(
         position_limits: Position size limits
         risk_limits: Risk management limits
         verbose: Show progress bar
+        safe_mode: Swallow and log strategy errors per bar; set False
+            to let exceptions propagate (slightly faster hot loop)
     
     Returns:
         BacktestResults object
@@ -92,7 +95,7 @@ def run_backtest(
     )
     
     # Run backtest
-    raw_results = engine.run(strategy, params)
+    raw_results = engine.run(strategy, params, safe_mode=safe_mode)
     
     # Calculate metrics
     metrics = calculate_metrics(
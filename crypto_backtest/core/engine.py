@@ -2,17 +2,69 @@
 Core backtesting engine (internal use)
 """
 
+import functools
+from collections.abc import Mapping
+
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Callable, Any, Optional
-from collections import deque
 from tqdm import tqdm
 
-from .events import MarketEvent, OrderEvent, FillEvent
+from .events import OrderEvent
 from .portfolio import Portfolio
 from .execution import ExecutionHandler
 
 
+class _SymbolSnapshot(Mapping):
+    """Lazy per-symbol view of data up to the current bar
+
+    OHLCV is sliced eagerly since nearly every strategy reads it, but
+    orderbook and trade slices are only computed when actually
+    subscripted, so pure-OHLCV strategies never pay for them.
+    """
+
+    __slots__ = ('_engine', '_symbol', '_keys', '_ohlcv', '_ts_i8')
+
+    def __init__(self, engine, symbol):
+        self._engine = engine
+        self._symbol = symbol
+        self._keys = tuple(engine._index_arrays[symbol])
+        self._ohlcv = None
+        self._ts_i8 = 0
+
+    def _refresh(self, ts_i8, ohlcv):
+        self._ts_i8 = ts_i8
+        self._ohlcv = ohlcv
+
+    def __getitem__(self, key):
+        if key == 'ohlcv':
+            if self._ohlcv is None:
+                raise KeyError(key)
+            return self._ohlcv
+        if key not in self._keys:
+            raise KeyError(key)
+        engine = self._engine
+        symbol = self._symbol
+        ts_i8 = self._ts_i8
+        count = engine._advance_cursor(symbol, key, ts_i8)
+        if key == 'trades':
+            return engine.data[symbol]['trades'].iloc[:count]
+        # Orderbook: exact-match row for the current bar, else empty
+        index_arr = engine._index_arrays[symbol]['orderbook']
+        if count > 0 and index_arr[count - 1] == ts_i8:
+            return engine.data[symbol]['orderbook'].iloc[count - 1]
+        return {}
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+
 class BacktestEngine:
     """Main backtesting engine"""
     
@@ -41,127 +93,183 @@ class BacktestEngine:
         # Get all timestamps
         self.timestamps = self._get_all_timestamps()
         self.current_idx = 0
-        
-        # Event queue
-        self.events = deque()
-        
-        # Results storage
-        self.equity_curve = []
-        self.positions_history = []
-    
-    def _get_all_timestamps(self) -> List[pd.Timestamp]:
-        """Get unified timestamp index from all data"""
-        all_timestamps = set()
-        
+
+        # Per-symbol integer cursors into each sorted index, advanced
+        # monotonically as the main loop walks the timestamp grid.
+        # Indexes are kept as int64 nanoseconds so cursor advancement is
+        # a searchsorted on plain integers, with no Timestamp hashing.
+        self._index_arrays = {}
+        self._cursors = {}
         for symbol, data_dict in self.data.items():
-            if 'ohlcv' in data_dict and not data_dict['ohlcv'].empty:
-                all_timestamps.update(data_dict['ohlcv'].index)
+            arrays = {}
+            for key in ('ohlcv', 'orderbook', 'trades'):
+                if key in data_dict and not data_dict[key].empty:
+                    arrays[key] = data_dict[key].index.values.view('int64')
+            self._index_arrays[symbol] = arrays
+            self._cursors[symbol] = {key: 0 for key in arrays}
+        self._timestamps_i8 = self.timestamps.view('int64')
+
+        # Raw close arrays and the per-bar latest-close cache
+        self._close_arrays = {
+            symbol: data_dict['ohlcv']['close'].to_numpy()
+            for symbol, data_dict in self.data.items()
+            if 'ohlcv' in data_dict and not data_dict['ohlcv'].empty
+        }
+        self._last_close: Dict[str, float] = {}
+
+        # Reusable snapshot container handed to the strategy each bar;
+        # per-symbol views are refreshed in place, never reallocated
+        self._snap = {symbol: _SymbolSnapshot(self, symbol) for symbol in self.data}
+
+        # Align portfolio size slots with a dense price vector so equity
+        # valuation is a single dot product per bar
+        self._symbols = list(self._close_arrays)
+        self._symbol_pos = {symbol: i for i, symbol in enumerate(self._symbols)}
+        self.portfolio.register_symbols(self._symbols)
+        self._prices_vec = np.zeros(len(self._symbols), dtype=np.float64)
+
+        # Set by from_aligned: an (n_bars, n_symbols) close matrix that
+        # replaces the per-symbol cursor walk for price lookups
+        self._close_mat = None
         
-        return sorted(list(all_timestamps))
+        # Results storage, preallocated to one slot per bar
+        self._equity = np.empty(len(self.timestamps), dtype=np.float64)
+        self.positions_history = []
     
-    def run(self, strategy: Callable, params: Dict[str, Any] = None) -> Dict:
-        """Run backtest with given strategy"""
-        params = params or {}
-        
-        # Progress bar
-        pbar = tqdm(total=len(self.timestamps), desc="Backtesting", disable=not self.verbose)
-        
-        for self.current_idx, timestamp in enumerate(self.timestamps):
-            # Generate market events
-            self._update_market_data(timestamp)
-            
-            # Get current data snapshot
-            current_data = self._get_current_data(timestamp)
-            
-            # Get current positions
-            positions = self.portfolio.get_position_dict()
-            
-            # Call strategy
-            try:
-                orders = strategy(current_data, positions, timestamp, **params)
-            except Exception as e:
-                if self.verbose:
-                    print(f"Strategy error at {timestamp}: {e}")
-                orders = []
-            
-            # Process orders
-            self._process_orders(orders, timestamp, current_data)
-            
-            # Update portfolio value
-            self._update_portfolio_value(timestamp, current_data)
-            
-            pbar.update(1)
+    @classmethod
+    def from_aligned(
+        cls,
+        bars: np.ndarray,
+        symbols: List[str],
+        timestamps,
+        **kwargs
+    ) -> 'BacktestEngine':
+        """Build an engine from a pre-aligned OHLCV tensor
+
+        Args:
+            bars: Array of shape (n_bars, n_symbols, 5) holding
+                open/high/low/close/volume on a shared timestamp grid;
+                every cell must be populated (no NaNs)
+            symbols: Symbol per tensor column
+            timestamps: Shared timestamp grid (datetime-like)
+            **kwargs: Forwarded to the regular constructor
+
+        The per-symbol DataFrames handed to strategies are materialized
+        once from the tensor; price lookups and equity valuation then
+        read contiguous tensor rows instead of walking cursors.
+        """
+        index = pd.DatetimeIndex(timestamps)
+        columns = ['open', 'high', 'low', 'close', 'volume']
+        data = {
+            symbol: {'ohlcv': pd.DataFrame(bars[:, j, :], index=index, columns=columns)}
+            for j, symbol in enumerate(symbols)
+        }
+        engine = cls(data, **kwargs)
+        engine._close_mat = np.ascontiguousarray(bars[..., 3], dtype=np.float64)
+        return engine
+
+    def _get_all_timestamps(self) -> np.ndarray:
+        """Get unified timestamp grid from all data as a datetime64 array"""
+        arrays = [
+            data_dict['ohlcv'].index.values
+            for data_dict in self.data.values()
+            if 'ohlcv' in data_dict and not data_dict['ohlcv'].empty
+        ]
+        if not arrays:
+            return np.array([], dtype='datetime64[ns]')
+        return np.unique(np.concatenate(arrays))
     
-    def run(self, strategy: Callable, params: Dict[str, Any] = None) -> Dict:
-        """Run backtest with given strategy"""
-        params = params or {}
-        
+    def run(self, strategy: Callable, params: Dict[str, Any] = None,
+            safe_mode: bool = True) -> Dict:
+        """Run backtest with given strategy
+
+        With safe_mode=False strategy exceptions propagate instead of
+        being swallowed per bar, keeping the hot loop free of the
+        try/except and error-formatting path.
+        """
+        # Bind strategy parameters once instead of unpacking **params
+        # on every bar
+        bound = functools.partial(strategy, **params) if params else strategy
+
+        if safe_mode:
+            verbose = self.verbose
+
+            def invoke(current_data, positions, timestamp):
+                try:
+                    return bound(current_data, positions, timestamp)
+                except Exception as e:
+                    if verbose:
+                        print(f"Strategy error at {timestamp}: {e}")
+                    return []
+        else:
+            invoke = bound
+
         # Progress bar
         pbar = tqdm(total=len(self.timestamps), desc="Backtesting", disable=not self.verbose)
         
         for self.current_idx, timestamp in enumerate(self.timestamps):
-            # Generate market events
-            self._update_market_data(timestamp)
-            
             # Get current data snapshot
             current_data = self._get_current_data(timestamp)
-            
+
+            # Cache latest close prices for this bar
+            self._update_last_close()
+
             # Get current positions
             positions = self.portfolio.get_position_dict()
-            
+
             # Call strategy
-            try:
-                orders = strategy(current_data, positions, timestamp, **params)
-            except Exception as e:
-                if self.verbose:
-                    print(f"Strategy error at {timestamp}: {e}")
-                orders = []
-            
+            orders = invoke(current_data, positions, timestamp)
+
             # Process orders
             self._process_orders(orders, timestamp, current_data)
-            
+
             # Update portfolio value
             self._update_portfolio_value(timestamp, current_data)
-            
+
             pbar.update(1)
-        
+
         pbar.close()
         
         return self._compile_results()
     
-    def _update_market_data(self, timestamp: pd.Timestamp):
-        """Update market data for current timestamp"""
-        for symbol, data_dict in self.data.items():
-            if 'ohlcv' in data_dict and timestamp in data_dict['ohlcv'].index:
-                event = MarketEvent(
-                    timestamp=timestamp,
-                    symbol=symbol,
-                    data={'ohlcv': data_dict['ohlcv'].loc[timestamp]}
-                )
-                self.events.append(event)
-    
+    def _update_last_close(self):
+        """Refresh the latest-close cache from the advanced cursors"""
+        if self._close_mat is not None:
+            # Aligned tensor: the current row already is the price vector
+            self._prices_vec = self._close_mat[self.current_idx]
+            return
+        for i, symbol in enumerate(self._symbols):
+            count = self._cursors[symbol]['ohlcv']
+            if count > 0:
+                price = self._close_arrays[symbol][count - 1]
+                self._last_close[symbol] = price
+                self._prices_vec[i] = price
+
+    def _advance_cursor(self, symbol: str, key: str, ts_i8: int) -> int:
+        """Advance a cursor past all index entries <= ts_i8, return row count"""
+        index_arr = self._index_arrays[symbol][key]
+        count = self._cursors[symbol][key]
+        count += int(np.searchsorted(index_arr[count:], ts_i8, side='right'))
+        self._cursors[symbol][key] = count
+        return count
+
     def _get_current_data(self, timestamp: pd.Timestamp) -> Dict:
-        """Get data snapshot up to current timestamp"""
-        result = {}
-        
+        """Get data snapshot up to current timestamp
+
+        The returned container is reused across bars; strategies that
+        keep a reference past the current bar must copy it. Orderbook
+        and trade slices are deferred until a strategy reads them.
+        """
+        ts_i8 = self._timestamps_i8[self.current_idx]
         for symbol, data_dict in self.data.items():
-            result[symbol] = {}
-            
-            # OHLCV data
-            if 'ohlcv' in data_dict:
-                df = data_dict['ohlcv']
-                result[symbol]['ohlcv'] = df[df.index <= timestamp]
-            
-            # Orderbook data (if available)
-            if 'orderbook' in data_dict and not data_dict['orderbook'].empty:
-                result[symbol]['orderbook'] = data_dict['orderbook'].loc[timestamp] if timestamp in data_dict['orderbook'].index else {}
-            
-            # Trade data (if available)
-            if 'trades' in data_dict and not data_dict['trades'].empty:
-                trades = data_dict['trades']
-                result[symbol]['trades'] = trades[trades.index <= timestamp]
-        
-        return result
+            arrays = self._index_arrays[symbol]
+            ohlcv = None
+            if 'ohlcv' in arrays:
+                count = self._advance_cursor(symbol, 'ohlcv', ts_i8)
+                ohlcv = data_dict['ohlcv'].iloc[:count]
+            self._snap[symbol]._refresh(ts_i8, ohlcv)
+
+        return self._snap
     
     def _process_orders(self, orders: Any, timestamp: pd.Timestamp, current_data: Dict):
         """Process orders from strategy"""
@@ -199,19 +307,20 @@ class BacktestEngine:
         """Execute order with slippage and commission"""
         if order.symbol not in current_data:
             return
-        
-        # Get current price
-        if 'ohlcv' in current_data[order.symbol]:
-            ohlcv = current_data[order.symbol]['ohlcv']
-            if not ohlcv.empty:
-                current_price = ohlcv.iloc[-1]['close']
-            else:
-                return
+
+        # Get current price from the per-bar close cache
+        if self._close_mat is not None:
+            current_price = float(self._prices_vec[self._symbol_pos[order.symbol]])
         else:
-            return
+            current_price = self._last_close.get(order.symbol)
+            if current_price is None:
+                return
         
-        # Get orderbook if available
-        orderbook = current_data[order.symbol].get('orderbook', {})
+        # Fetch the orderbook only if the slippage model consumes it
+        if self.execution.needs_orderbook:
+            orderbook = current_data[order.symbol].get('orderbook', {})
+        else:
+            orderbook = None
         
         # Execute with slippage
         fill = self.execution.execute_order(order, current_price, orderbook)
@@ -234,26 +343,22 @@ class BacktestEngine:
     
     def _update_portfolio_value(self, timestamp: pd.Timestamp, current_data: Dict):
         """Update portfolio equity value"""
-        prices = {}
-        # Get current prices for all symbols in the data (not just positions)
-        for symbol, data_dict in current_data.items():
-            if 'ohlcv' in data_dict and not data_dict['ohlcv'].empty:
-                prices[symbol] = data_dict['ohlcv'].iloc[-1]['close']
-        
-        equity = self.portfolio.calculate_equity(prices)
-        self.portfolio.equity_curve.append(equity)
-        self.portfolio.timestamps.append(timestamp)
+        # The price vector already holds the last close per symbol up to
+        # this bar, so equity is cash plus a sizes/prices dot product
+        equity = self.portfolio.calculate_equity(self._prices_vec)
+        self._equity[self.current_idx] = equity
 
     def _compile_results(self) -> Dict:
         """Compile backtest results"""
         return {
             'equity_curve': pd.Series(
-                data=self.portfolio.equity_curve,
-                index=self.portfolio.timestamps
+                data=self._equity,
+                index=pd.DatetimeIndex(self.timestamps),
+                copy=False
             ),
-            'trades': pd.DataFrame(self.portfolio.trades),
+            'trades': self.portfolio.trades_frame(),
             'final_portfolio': self.portfolio.get_position_dict(),
             'initial_capital': self.initial_capital,
             'final_capital': self.portfolio.cash,
-            'final_equity': self.portfolio.equity_curve[-1] if self.portfolio.equity_curve else self.initial_capital
+            'final_equity': self._equity[-1] if len(self._equity) > 0 else self.initial_capital
         }
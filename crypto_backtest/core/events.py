@@ -5,6 +5,7 @@ Event system for backtesting engine (internal use)
 from enum import Enum
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
+import numpy as np
 import pandas as pd
 
 
@@ -65,6 +66,128 @@ class FillEvent(Event):
     price: float
     commission: float
     slippage: float
-    
+
     def __post_init__(self):
         self.type = EventType.FILL
+
+
+# Integer codes used by the columnar buffer
+SIDE_BUY = 1
+SIDE_SELL = -1
+_EVENT_TYPE_CODES = {event_type: code for code, event_type in enumerate(EventType)}
+_FILL_CODE = _EVENT_TYPE_CODES[EventType.FILL]
+
+
+class EventBuffer:
+    """Columnar (structure-of-arrays) store for fill events
+
+    One per-event dataclass allocation fragments memory and kills cache
+    locality when scanning millions of events, so the hot path appends
+    into parallel, contiguous numpy columns instead. Symbols are
+    interned to int32 ids; the dataclasses above remain the views used
+    at API boundaries (see :meth:`fill_at`).
+    """
+
+    __slots__ = ('_n', '_timestamps', '_symbol_ids', '_types', '_sides',
+                 '_sizes', '_prices', '_commissions', '_slippages',
+                 '_symbol_idx', '_symbol_names')
+
+    _INITIAL_CAPACITY = 256
+
+    def __init__(self):
+        capacity = self._INITIAL_CAPACITY
+        self._n = 0
+        self._timestamps = np.empty(capacity, dtype='datetime64[ns]')
+        self._symbol_ids = np.empty(capacity, dtype=np.int32)
+        self._types = np.empty(capacity, dtype=np.int8)
+        self._sides = np.empty(capacity, dtype=np.int8)
+        self._sizes = np.empty(capacity, dtype=np.float64)
+        self._prices = np.empty(capacity, dtype=np.float64)
+        self._commissions = np.empty(capacity, dtype=np.float64)
+        self._slippages = np.empty(capacity, dtype=np.float64)
+        self._symbol_idx: Dict[str, int] = {}
+        self._symbol_names: List[str] = []
+
+    def __len__(self) -> int:
+        return self._n
+
+    def symbol_id(self, symbol: str) -> int:
+        """Intern a symbol, returning its stable integer id"""
+        idx = self._symbol_idx.get(symbol)
+        if idx is None:
+            idx = len(self._symbol_names)
+            self._symbol_idx[symbol] = idx
+            self._symbol_names.append(symbol)
+        return idx
+
+    def _grow(self):
+        capacity = max(self._INITIAL_CAPACITY, 2 * self._timestamps.shape[0])
+        for name in ('_timestamps', '_symbol_ids', '_types', '_sides',
+                     '_sizes', '_prices', '_commissions', '_slippages'):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self._n] = old[:self._n]
+            setattr(self, name, new)
+
+    def add_fill(self, timestamp, symbol: str, side: str, size: float,
+                 price: float, commission: float = 0.0, slippage: float = 0.0):
+        """Append one fill; amortized O(1) via doubling growth"""
+        if self._n >= self._timestamps.shape[0]:
+            self._grow()
+        i = self._n
+        self._timestamps[i] = timestamp
+        self._symbol_ids[i] = self.symbol_id(symbol)
+        self._types[i] = _FILL_CODE
+        self._sides[i] = SIDE_BUY if side == 'buy' else SIDE_SELL
+        self._sizes[i] = size
+        self._prices[i] = price
+        self._commissions[i] = commission
+        self._slippages[i] = slippage
+        self._n = i + 1
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._timestamps[:self._n]
+
+    @property
+    def symbol_ids(self) -> np.ndarray:
+        return self._symbol_ids[:self._n]
+
+    @property
+    def symbol_names(self) -> List[str]:
+        """Interned symbols, positionally aligned with the id codes"""
+        return self._symbol_names
+
+    @property
+    def sides(self) -> np.ndarray:
+        return self._sides[:self._n]
+
+    @property
+    def sizes(self) -> np.ndarray:
+        return self._sizes[:self._n]
+
+    @property
+    def prices(self) -> np.ndarray:
+        return self._prices[:self._n]
+
+    @property
+    def commissions(self) -> np.ndarray:
+        return self._commissions[:self._n]
+
+    @property
+    def slippages(self) -> np.ndarray:
+        return self._slippages[:self._n]
+
+    def fill_at(self, i: int) -> FillEvent:
+        """Materialize one row as a FillEvent view object"""
+        if not 0 <= i < self._n:
+            raise IndexError(f"Event index {i} out of range")
+        return FillEvent(
+            timestamp=pd.Timestamp(self._timestamps[i]),
+            symbol=self._symbol_names[self._symbol_ids[i]],
+            side='buy' if self._sides[i] == SIDE_BUY else 'sell',
+            size=float(self._sizes[i]),
+            price=float(self._prices[i]),
+            commission=float(self._commissions[i]),
+            slippage=float(self._slippages[i])
+        )
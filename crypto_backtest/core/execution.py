@@ -2,34 +2,75 @@
 Order execution and slippage modeling (internal use)
 """
 
-import numpy as np
+import math
 from typing import Dict, Optional
+
 from .events import FillEvent
 
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is a hard dependency
+    def njit(*args, **kwargs):
+        def wrapper(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrapper
+
+
+@njit(cache=True)
+def _slippage_zero(size: float, price: float, bps: float) -> float:
+    return 0.0
+
+
+@njit(cache=True)
+def _slippage_linear(size: float, price: float, bps: float) -> float:
+    base_slippage = price * bps / 10000.0
+    size_factor = min(abs(size), 10.0) / 10.0  # Cap at 10x base size
+    return base_slippage * size_factor
+
+
+@njit(cache=True)
+def _slippage_square_root(size: float, price: float, bps: float) -> float:
+    base_slippage = price * bps / 10000.0
+    return base_slippage * math.sqrt(abs(size))
+
+
+_SLIPPAGE_MODELS = {
+    'zero': _slippage_zero,
+    'linear': _slippage_linear,
+    'square_root': _slippage_square_root,
+}
+
 
 class ExecutionHandler:
     """Handles order execution with slippage and commission"""
-    
-    def __init__(self, commission: float = 0.001, slippage_model: str = 'linear', 
+
+    def __init__(self, commission: float = 0.001, slippage_model: str = 'linear',
                  slippage_bps: float = 10):
         self.commission = commission
         self.slippage_model = slippage_model
         self.slippage_bps = slippage_bps
-    
+        # Resolve the model once at init instead of string-branching per order
+        self._slippage_fn = _SLIPPAGE_MODELS.get(slippage_model, _slippage_zero)
+        # None of the built-in models consume the book, so the engine
+        # can skip fetching it entirely
+        self.needs_orderbook = False
+
     def execute_order(self, order, current_price: float, orderbook: Optional[Dict] = None) -> FillEvent:
         """Execute order and return fill event"""
         # Calculate slippage
         slippage = self._calculate_slippage(order.size, current_price, order.side, orderbook)
-        
+
         # Adjust price for slippage
         if order.side == 'buy':
             fill_price = current_price + slippage
         else:
             fill_price = current_price - slippage
-        
+
         # Calculate commission
         commission_amount = abs(order.size) * fill_price * self.commission
-        
+
         return FillEvent(
             timestamp=order.timestamp,
             symbol=order.symbol,
@@ -39,24 +80,8 @@ class ExecutionHandler:
             commission=commission_amount,
             slippage=slippage
         )
-    
-    def _calculate_slippage(self, size: float, price: float, side: str, 
+
+    def _calculate_slippage(self, size: float, price: float, side: str,
                            orderbook: Optional[Dict] = None) -> float:
         """Calculate slippage based on model"""
-        if self.slippage_model == 'zero':
-            return 0.0
-        
-        elif self.slippage_model == 'linear':
-            # Simple linear slippage based on size
-            base_slippage = price * self.slippage_bps / 10000
-            size_factor = min(abs(size), 10) / 10  # Cap at 10x base size
-            return base_slippage * size_factor
-        
-        elif self.slippage_model == 'square_root':
-            # Square root market impact model
-            base_slippage = price * self.slippage_bps / 10000
-            size_factor = np.sqrt(abs(size))
-            return base_slippage * size_factor
-        
-        else:
-            return 0.0
+        return self._slippage_fn(size, price, self.slippage_bps)
@@ -4,85 +4,141 @@ Portfolio tracking and management (internal use)
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional
-from dataclasses import dataclass, field
-from collections import defaultdict
+from typing import Dict
+from dataclasses import dataclass
+
+from .events import EventBuffer, SIDE_SELL
 
 
 @dataclass
 class Position:
     """Single position in a symbol"""
+    __slots__ = ('symbol', 'size', 'avg_price', 'timestamp')
+
     symbol: str
     size: float
     avg_price: float
     timestamp: pd.Timestamp
-    
+
     @property
     def market_value(self):
         return self.size * self.avg_price
-    
+
     @property
     def is_long(self):
         return self.size > 0
-    
+
     @property
     def is_short(self):
         return self.size < 0
 
 
-@dataclass
 class Portfolio:
     """Portfolio state tracker"""
-    initial_capital: float
-    cash: float = field(init=False)
-    positions: Dict[str, Position] = field(default_factory=dict)
-    equity_curve: List[float] = field(default_factory=list)
-    timestamps: List[pd.Timestamp] = field(default_factory=list)
-    trades: List[Dict] = field(default_factory=list)
-    
-    def __post_init__(self):
-        self.cash = self.initial_capital
-    
+    __slots__ = (
+        'initial_capital', 'cash', 'positions', '_position_sizes',
+        '_symbol_idx', '_sizes', '_events'
+    )
+
+    def __init__(self, initial_capital: float):
+        self.initial_capital = initial_capital
+        self.cash = initial_capital
+        self.positions: Dict[str, Position] = {}
+        self._position_sizes: Dict[str, float] = {}
+        # Position sizes mirrored into a dense array so equity is a dot
+        # product; slots are assigned per symbol and keep a 0 when flat
+        self._symbol_idx: Dict[str, int] = {}
+        self._sizes = np.zeros(0, dtype=np.float64)
+        # Trade log: columnar fill buffer shared with the event system
+        self._events = EventBuffer()
+
+    def register_symbols(self, symbols):
+        """Pre-assign size slots so prices can be passed as an aligned array"""
+        for symbol in symbols:
+            self._ensure_slot(symbol)
+
+    def _ensure_slot(self, symbol: str) -> int:
+        idx = self._symbol_idx.get(symbol)
+        if idx is None:
+            idx = len(self._symbol_idx)
+            self._symbol_idx[symbol] = idx
+            if idx >= len(self._sizes):
+                grown = np.zeros(max(8, 2 * len(self._sizes)), dtype=np.float64)
+                grown[:len(self._sizes)] = self._sizes
+                self._sizes = grown
+        return idx
+
     def update_position(self, symbol: str, size: float, price: float, timestamp: pd.Timestamp):
         """Update or create position"""
+        slot = self._ensure_slot(symbol)
         if symbol in self.positions:
             pos = self.positions[symbol]
-            new_size = pos.size + size
-            
+            old_size = pos.size
+            new_size = old_size + size
+
             if abs(new_size) < 1e-8:  # Position closed
                 del self.positions[symbol]
+                del self._position_sizes[symbol]
+                self._sizes[slot] = 0.0
             else:
                 # Update average price
-                if pos.size * size > 0:  # Adding to position
-                    pos.avg_price = (pos.avg_price * abs(pos.size) + price * abs(size)) / abs(new_size)
+                if old_size * size > 0:  # Adding to position
+                    pos.avg_price = (pos.avg_price * abs(old_size) + price * abs(size)) / abs(new_size)
                 pos.size = new_size
+                self._position_sizes[symbol] = new_size
+                self._sizes[slot] = new_size
         else:
             if abs(size) > 1e-8:
                 self.positions[symbol] = Position(symbol, size, price, timestamp)
-    
+                self._position_sizes[symbol] = size
+                self._sizes[slot] = size
+
     def get_position_dict(self) -> Dict[str, float]:
         """Get position sizes as dict for strategy function"""
-        result = {symbol: pos.size for symbol, pos in self.positions.items()}
+        # Sizes are maintained incrementally by update_position, so the
+        # per-bar cost is one shallow copy rather than a full rebuild
+        result = dict(self._position_sizes)
         result['cash'] = self.cash
         return result
     
-    def calculate_equity(self, prices: Dict[str, float]) -> float:
-        """Calculate total portfolio value"""
+    def calculate_equity(self, prices) -> float:
+        """Calculate total portfolio value
+
+        Accepts either a price vector aligned to the registered symbol
+        slots (fast path) or a symbol->price dict.
+        """
+        if isinstance(prices, np.ndarray):
+            n = len(prices)
+            return self.cash + float(self._sizes[:n] @ prices)
         equity = self.cash
         for symbol, pos in self.positions.items():
             if symbol in prices:
                 equity += pos.size * prices[symbol]
         return equity
     
-    def record_trade(self, symbol: str, side: str, size: float, price: float, 
+    def record_trade(self, symbol: str, side: str, size: float, price: float,
                     commission: float, timestamp: pd.Timestamp):
         """Record executed trade"""
-        self.trades.append({
-            'timestamp': timestamp,
-            'symbol': symbol,
-            'side': side,
-            'size': size,
-            'price': price,
-            'commission': commission,
-            'value': size * price
+        self._events.add_fill(timestamp, symbol, side, size, price, commission)
+
+    def trades_frame(self) -> pd.DataFrame:
+        """Materialize the trade log as a DataFrame"""
+        events = self._events
+        sizes = events.sizes
+        prices = events.prices
+        return pd.DataFrame({
+            'timestamp': events.timestamps,
+            # Categoricals straight from the interned codes: one small
+            # integer per row instead of one string object
+            'symbol': pd.Categorical.from_codes(
+                events.symbol_ids, categories=events.symbol_names
+            ),
+            'side': pd.Categorical.from_codes(
+                (events.sides == SIDE_SELL).view(np.int8),
+                categories=['buy', 'sell']
+            ),
+            'size': sizes,
+            'price': prices,
+            'commission': events.commissions,
+            'value': sizes * prices
         })
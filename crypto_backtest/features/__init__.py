@@ -19,6 +19,7 @@ from .statistical import (
 from .microstructure import (
     bid_ask_spread, effective_spread,
     book_imbalance, book_pressure,
+    order_flow_imbalance,
     vpin, trade_flow_toxicity,
     kyle_lambda, aggressive_flow
 )
@@ -29,6 +30,36 @@ from .arbitrage import (
     granger_causality
 )
 
+
+def warmup():
+    """Compile every JIT feature kernel once on tiny dummy inputs
+
+    With cache=True the compiled machine code is written to numba's
+    on-disk cache, so callers (and any worker processes they spawn) pay
+    seconds of compile time at most once instead of once per process.
+    """
+    from ._njit import NUMBA_AVAILABLE
+    if not NUMBA_AVAILABLE:
+        return
+
+    import numpy as np
+    from . import technical as _t
+    from . import microstructure as _m
+    from . import statistical as _s
+
+    x = np.arange(8, dtype=np.float64)
+    out = np.empty(8, dtype=np.float64)
+    _t._rolling_mean(x, 3, out)
+    _t._bbands_loop(x, 3, 2.0, out.copy(), out.copy(), out.copy())
+    _t._roll_min_max(x, x + 1.0, 3, out.copy(), out.copy())
+    _t._obv_loop(x, x, out.copy())
+    _t._ema_loop(x, 0.5, out.copy())
+    _t._dual_ema(x, 0.5, 0.25, out.copy(), out.copy())
+    _t._rsi_loop(np.diff(x, prepend=0.0), 3, out.copy())
+    _m._ofi(x, x, x, x, x, x, x, x, out.copy())
+    _s._adf_tstat(x)
+
+
 __all__ = [
     # Technical
     'sma', 'ema', 'wma', 'vwap',
@@ -44,11 +75,15 @@ __all__ = [
     # Microstructure
     'bid_ask_spread', 'effective_spread',
     'book_imbalance', 'book_pressure',
+    'order_flow_imbalance',
     'vpin', 'trade_flow_toxicity',
     'kyle_lambda', 'aggressive_flow',
     
     # Arbitrage
     'calc_arb_spread', 'triangular_arb',
     'funding_arb', 'lead_lag_signal',
-    'granger_causality'
+    'granger_causality',
+
+    # JIT cache warm-up
+    'warmup'
 ]
@@ -0,0 +1,24 @@
+"""
+Numba import shim for feature kernels (internal use)
+
+Feature modules import `njit` from here; when numba is unavailable the
+decorator degrades to a no-op so every kernel still runs as plain
+Python.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+    # Keyword arguments for pandas rolling/ewm aggregations that
+    # support the numba execution engine
+    ROLLING_KW = {'engine': 'numba', 'engine_kwargs': {'nopython': True, 'nogil': True}}
+except ImportError:  # pragma: no cover - numba is a hard dependency
+    NUMBA_AVAILABLE = False
+    ROLLING_KW = {}
+
+    def njit(*args, **kwargs):
+        def wrapper(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrapper
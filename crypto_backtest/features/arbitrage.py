@@ -4,6 +4,7 @@ Arbitrage calculation features
 
 import pandas as pd
 import numpy as np
+from scipy.signal import correlate
 from typing import Tuple
 
 
@@ -58,18 +59,21 @@ def lead_lag_signal(series1: pd.Series, series2: pd.Series, max_lag: int = 10) -
     
     Returns signal indicating when series1 leads series2
     """
-    correlations = []
-    for lag in range(-max_lag, max_lag + 1):
-        if lag < 0:
-            corr = series1.iloc[:lag].corr(series2.iloc[-lag:])
-        elif lag > 0:
-            corr = series1.iloc[lag:].corr(series2.iloc[:-lag])
-        else:
-            corr = series1.corr(series2)
-        correlations.append(corr)
-    
+    # Z-score both series once, then get all lags from a single
+    # FFT-based cross-correlation instead of one pairwise corr per lag
+    x = series1.to_numpy(dtype=np.float64)
+    y = series2.to_numpy(dtype=np.float64)
+    x = np.nan_to_num((x - np.nanmean(x)) / np.nanstd(x))
+    y = np.nan_to_num((y - np.nanmean(y)) / np.nanstd(y))
+
+    n = len(x)
+    correlations = correlate(x, y, mode='full', method='fft') / n
+
+    # Index n-1+lag pairs series1[t+lag] with series2[t]
+    window = correlations[n - 1 - max_lag: n + max_lag]
+
     # Find optimal lag
-    optimal_lag = np.argmax(correlations) - max_lag
+    optimal_lag = int(np.argmax(window)) - max_lag
     
     # Create signal based on optimal lag
     if optimal_lag > 0:
@@ -6,15 +6,58 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Optional
 
+from ._njit import njit
+
+
+@njit(cache=True)
+def _ofi(prev_b_p, prev_b_v, cur_b_p, cur_b_v,
+         prev_a_p, prev_a_v, cur_a_p, cur_a_v, out):
+    """Per-level order flow imbalance (bid flow minus ask flow)
+
+    Piecewise per level: a side contributes its full current volume
+    when its price improves, the volume delta when the price is
+    unchanged, and minus its previous volume when the price worsens.
+    """
+    for i in range(out.shape[0]):
+        if cur_b_p[i] > prev_b_p[i]:
+            b_of = cur_b_v[i]
+        elif cur_b_p[i] == prev_b_p[i]:
+            b_of = cur_b_v[i] - prev_b_v[i]
+        else:
+            b_of = -prev_b_v[i]
+
+        if cur_a_p[i] < prev_a_p[i]:
+            a_of = cur_a_v[i]
+        elif cur_a_p[i] == prev_a_p[i]:
+            a_of = cur_a_v[i] - prev_a_v[i]
+        else:
+            a_of = -prev_a_v[i]
+
+        out[i] = b_of - a_of
+
+
+def _book_sides(orderbook: Dict):
+    """Return (bids, asks) as float64 ndarrays of shape (levels, 2)
+
+    Callers may store book levels either as lists of [price, volume]
+    pairs or as preallocated ndarrays; the latter is free here since
+    np.asarray is a no-op on an existing float64 array.
+    """
+    if 'bids' not in orderbook or 'asks' not in orderbook:
+        return None, None
+    bids = np.asarray(orderbook['bids'], dtype=np.float64)
+    asks = np.asarray(orderbook['asks'], dtype=np.float64)
+    if bids.size == 0 or asks.size == 0:
+        return None, None
+    return bids, asks
+
 
 def bid_ask_spread(orderbook: Dict) -> float:
     """Calculate bid-ask spread"""
-    if 'bids' in orderbook and 'asks' in orderbook:
-        if len(orderbook['bids']) > 0 and len(orderbook['asks']) > 0:
-            best_bid = orderbook['bids'][0][0]
-            best_ask = orderbook['asks'][0][0]
-            return best_ask - best_bid
-    return np.nan
+    bids, asks = _book_sides(orderbook)
+    if bids is None:
+        return np.nan
+    return float(asks[0, 0] - bids[0, 0])
 
 
 def effective_spread(trades: pd.DataFrame, orderbook: Dict) -> float:
@@ -25,36 +68,50 @@ def effective_spread(trades: pd.DataFrame, orderbook: Dict) -> float:
 
 def book_imbalance(orderbook: Dict, levels: int = 5) -> float:
     """Order book imbalance"""
-    if 'bids' not in orderbook or 'asks' not in orderbook:
+    bids, asks = _book_sides(orderbook)
+    if bids is None:
         return 0.0
-    
-    bid_volume = sum(bid[1] for bid in orderbook['bids'][:levels])
-    ask_volume = sum(ask[1] for ask in orderbook['asks'][:levels])
-    
+
+    bid_volume = bids[:levels, 1].sum()
+    ask_volume = asks[:levels, 1].sum()
+
     if bid_volume + ask_volume > 0:
-        return (bid_volume - ask_volume) / (bid_volume + ask_volume)
+        return float((bid_volume - ask_volume) / (bid_volume + ask_volume))
     return 0.0
 
 
 def book_pressure(orderbook: Dict) -> float:
     """Order book pressure indicator"""
-    if 'bids' not in orderbook or 'asks' not in orderbook:
+    bids, asks = _book_sides(orderbook)
+    if bids is None:
         return 0.0
-    
-    # Weight by distance from mid price
-    mid_price = (orderbook['bids'][0][0] + orderbook['asks'][0][0]) / 2
-    
-    bid_pressure = sum(
-        bid[1] / (1 + abs(bid[0] - mid_price) / mid_price)
-        for bid in orderbook['bids'][:10]
-    )
-    
-    ask_pressure = sum(
-        ask[1] / (1 + abs(ask[0] - mid_price) / mid_price)
-        for ask in orderbook['asks'][:10]
+
+    # Weight by distance from mid price; one vector op per side
+    mid_price = (bids[0, 0] + asks[0, 0]) / 2
+
+    weights_b = 1.0 / (1.0 + np.abs(bids[:10, 0] - mid_price) / mid_price)
+    weights_a = 1.0 / (1.0 + np.abs(asks[:10, 0] - mid_price) / mid_price)
+
+    return float((bids[:10, 1] * weights_b).sum() - (asks[:10, 1] * weights_a).sum())
+
+
+def order_flow_imbalance(prev_orderbook: Dict, orderbook: Dict, levels: int = 10) -> np.ndarray:
+    """Per-level order flow imbalance between two book snapshots"""
+    prev_bids, prev_asks = _book_sides(prev_orderbook)
+    bids, asks = _book_sides(orderbook)
+    if prev_bids is None or bids is None:
+        return np.zeros(levels, dtype=np.float64)
+
+    depth = min(levels, len(prev_bids), len(prev_asks), len(bids), len(asks))
+    out = np.zeros(levels, dtype=np.float64)
+    _ofi(
+        np.ascontiguousarray(prev_bids[:depth, 0]), np.ascontiguousarray(prev_bids[:depth, 1]),
+        np.ascontiguousarray(bids[:depth, 0]), np.ascontiguousarray(bids[:depth, 1]),
+        np.ascontiguousarray(prev_asks[:depth, 0]), np.ascontiguousarray(prev_asks[:depth, 1]),
+        np.ascontiguousarray(asks[:depth, 0]), np.ascontiguousarray(asks[:depth, 1]),
+        out[:depth]
     )
-    
-    return bid_pressure - ask_pressure
+    return out
 
 
 def vpin(trades: pd.DataFrame, volume_bucket_size: float) -> pd.Series:
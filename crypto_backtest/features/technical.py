@@ -6,45 +6,315 @@ import pandas as pd
 import numpy as np
 from typing import Union, Tuple
 
+from ._njit import njit, ROLLING_KW
 
-def sma(series: pd.Series, period: int) -> pd.Series:
+
+@njit(cache=True)
+def _rolling_mean(x: np.ndarray, period: int, out: np.ndarray):
+    """Rolling mean via a running sum; NaN for the warm-up region
+
+    NaN inputs are kept out of the running sum and counted instead, so
+    windows containing a NaN emit NaN and clean windows recover once
+    the NaN leaves — matching pandas rolling().mean().
+    """
+    n = x.shape[0]
+    for i in range(n):
+        out[i] = np.nan
+    if n < period:
+        return
+    s = 0.0
+    nan_count = 0
+    for i in range(n):
+        v = x[i]
+        if np.isnan(v):
+            nan_count += 1
+        else:
+            s += v
+        if i >= period:
+            old = x[i - period]
+            if np.isnan(old):
+                nan_count -= 1
+            else:
+                s -= old
+        if i >= period - 1 and nan_count == 0:
+            out[i] = s / period
+
+
+@njit(cache=True)
+def _bbands_loop(x: np.ndarray, period: int, num_std: float,
+                 out_mid: np.ndarray, out_upper: np.ndarray, out_lower: np.ndarray):
+    """Rolling mean and sample std in one pass via running sums
+
+    NaN inputs are counted per window rather than summed, so a NaN
+    (e.g. the leading one from pct_change) yields NaN bands only while
+    it is in the window — same recovery as the pandas rolling pair.
+    """
+    n = x.shape[0]
+    for i in range(n):
+        out_mid[i] = np.nan
+        out_upper[i] = np.nan
+        out_lower[i] = np.nan
+    if n < period:
+        return
+    s = 0.0
+    s2 = 0.0
+    nan_count = 0
+    for i in range(n):
+        v = x[i]
+        if np.isnan(v):
+            nan_count += 1
+        else:
+            s += v
+            s2 += v * v
+        if i >= period:
+            old = x[i - period]
+            if np.isnan(old):
+                nan_count -= 1
+            else:
+                s -= old
+                s2 -= old * old
+        if i >= period - 1 and nan_count == 0:
+            mean = s / period
+            # Sample variance (ddof=1), matching pandas rolling().std()
+            var = (s2 - s * s / period) / (period - 1)
+            std = np.sqrt(var) if var > 0 else 0.0
+            out_mid[i] = mean
+            out_upper[i] = mean + num_std * std
+            out_lower[i] = mean - num_std * std
+
+
+@njit(cache=True)
+def _roll_min_max(low: np.ndarray, high: np.ndarray, period: int,
+                  out_min: np.ndarray, out_max: np.ndarray):
+    """Fused rolling min of `low` and max of `high` in one pass
+
+    Two monotonic deques (ring buffers of indices) advance together so
+    both arrays are scanned once, instead of pandas running its rolling
+    algorithm twice.
+    """
+    n = low.shape[0]
+    for i in range(n):
+        out_min[i] = np.nan
+        out_max[i] = np.nan
+    if n == 0 or period <= 0:
+        return
+
+    cap = period + 1
+    q_min = np.empty(cap, dtype=np.int64)
+    q_max = np.empty(cap, dtype=np.int64)
+    min_head = min_tail = 0
+    max_head = max_tail = 0
+
+    for i in range(n):
+        while min_tail != min_head and low[q_min[(min_tail - 1) % cap]] >= low[i]:
+            min_tail = (min_tail - 1) % cap
+        q_min[min_tail] = i
+        min_tail = (min_tail + 1) % cap
+        if q_min[min_head] <= i - period:
+            min_head = (min_head + 1) % cap
+
+        while max_tail != max_head and high[q_max[(max_tail - 1) % cap]] <= high[i]:
+            max_tail = (max_tail - 1) % cap
+        q_max[max_tail] = i
+        max_tail = (max_tail + 1) % cap
+        if q_max[max_head] <= i - period:
+            max_head = (max_head + 1) % cap
+
+        if i >= period - 1:
+            out_min[i] = low[q_min[min_head]]
+            out_max[i] = high[q_max[max_head]]
+
+
+@njit(cache=True)
+def _obv_loop(close: np.ndarray, volume: np.ndarray, out: np.ndarray):
+    """On Balance Volume accumulator in a single branchless pass"""
+    n = close.shape[0]
+    if n == 0:
+        return
+    acc = 0.0
+    out[0] = 0.0
+    for i in range(1, n):
+        sign = (close[i] > close[i - 1]) - (close[i] < close[i - 1])
+        acc += sign * volume[i]
+        out[i] = acc
+
+
+@njit(cache=True)
+def _ema_loop(x: np.ndarray, alpha: float, out: np.ndarray):
+    """Exponential moving average recurrence (adjust=False semantics)
+
+    NaN inputs are skipped with the last average carried forward, and
+    the old-value weight keeps decaying across the gap — the same
+    ewm(adjust=False, ignore_na=False) weighting pandas applies.
+    """
+    n = x.shape[0]
+    owf = 1.0 - alpha
+    avg = np.nan
+    old_wt = 1.0
+    for i in range(n):
+        cur = x[i]
+        if not np.isnan(avg):
+            old_wt *= owf
+            if not np.isnan(cur):
+                avg = (old_wt * avg + alpha * cur) / (old_wt + alpha)
+                old_wt = 1.0
+        elif not np.isnan(cur):
+            avg = cur
+        out[i] = avg
+
+
+@njit(cache=True)
+def _dual_ema(x: np.ndarray, alpha_fast: float, alpha_slow: float,
+              out_fast: np.ndarray, out_slow: np.ndarray):
+    """Fast and slow EMAs maintained together in one pass over `x`
+
+    NaN handling matches _ema_loop (pandas ewm skip/carry-forward).
+    """
+    n = x.shape[0]
+    owf_fast = 1.0 - alpha_fast
+    owf_slow = 1.0 - alpha_slow
+    avg_fast = np.nan
+    avg_slow = np.nan
+    old_wt_fast = 1.0
+    old_wt_slow = 1.0
+    for i in range(n):
+        cur = x[i]
+        is_obs = not np.isnan(cur)
+        if not np.isnan(avg_fast):
+            old_wt_fast *= owf_fast
+            old_wt_slow *= owf_slow
+            if is_obs:
+                avg_fast = (old_wt_fast * avg_fast + alpha_fast * cur) / (old_wt_fast + alpha_fast)
+                avg_slow = (old_wt_slow * avg_slow + alpha_slow * cur) / (old_wt_slow + alpha_slow)
+                old_wt_fast = 1.0
+                old_wt_slow = 1.0
+        elif is_obs:
+            avg_fast = cur
+            avg_slow = cur
+        out_fast[i] = avg_fast
+        out_slow[i] = avg_slow
+
+
+@njit(cache=True)
+def _rsi_loop(delta: np.ndarray, period: int, out: np.ndarray):
+    """Wilder-smoothed RSI in one pass over the price deltas
+
+    NaN deltas count as "no change" (zero gain, zero loss) in both the
+    seed window and the Wilder recursion — the same mapping the old
+    delta.where(delta > 0, 0) produced.
+    """
+    n = delta.shape[0]
+    for i in range(n):
+        out[i] = np.nan
+    if n <= period:
+        return
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        d = delta[i]
+        if d > 0:
+            avg_gain += d
+        elif d < 0:
+            avg_loss -= d
+    avg_gain /= period
+    avg_loss /= period
+
+    for i in range(period, n):
+        if i > period:
+            d = delta[i]
+            gain = d if d > 0 else 0.0
+            loss = -d if d < 0 else 0.0
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+        if avg_loss > 0:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        else:
+            out[i] = 100.0
+
+
+def _output(values: np.ndarray, index, return_numpy: bool) -> Union[pd.Series, np.ndarray]:
+    """Return the raw result array, or rebox it as a Series
+
+    The ndarray path skips pandas Series construction and metadata
+    propagation entirely — worthwhile when indicators run once per bar
+    inside a backtest loop.
+    """
+    if return_numpy:
+        return values
+    return pd.Series(values, index=index)
+
+
+def sma(series: pd.Series, period: int, return_numpy: bool = False) -> Union[pd.Series, np.ndarray]:
     """Simple Moving Average"""
-    return series.rolling(window=period).mean()
+    if return_numpy:
+        x = np.asarray(series, dtype=np.float64)
+        out = np.empty_like(x)
+        _rolling_mean(x, period, out)
+        return out
+    return series.rolling(window=period).mean(**ROLLING_KW)
 
 
-def ema(series: pd.Series, period: int) -> pd.Series:
+def ema(series: pd.Series, period: int, return_numpy: bool = False) -> Union[pd.Series, np.ndarray]:
     """Exponential Moving Average"""
-    return series.ewm(span=period, adjust=False).mean()
+    if return_numpy:
+        x = np.asarray(series, dtype=np.float64)
+        out = np.empty_like(x)
+        _ema_loop(x, 2.0 / (period + 1), out)
+        return out
+    return series.ewm(span=period, adjust=False).mean(**ROLLING_KW)
 
 
 def wma(series: pd.Series, period: int) -> pd.Series:
     """Weighted Moving Average"""
-    weights = np.arange(1, period + 1)
-    return series.rolling(period).apply(lambda x: np.dot(x, weights) / weights.sum(), raw=True)
+    weights = np.arange(1, period + 1, dtype=np.float64)
+    weights /= weights.sum()
+    # One convolution pass instead of a Python callback per window
+    out = np.convolve(series.to_numpy(dtype=np.float64), weights[::-1], mode='valid')
+    return pd.Series(
+        np.concatenate([np.full(period - 1, np.nan), out]),
+        index=series.index
+    )
 
 
 def vwap(price: pd.Series, volume: pd.Series, period: int) -> pd.Series:
     """Volume Weighted Average Price"""
     typical_price = price
-    return (typical_price * volume).rolling(period).sum() / volume.rolling(period).sum()
+    pv_sum = (typical_price * volume).rolling(period).sum(**ROLLING_KW)
+    return pv_sum / volume.rolling(period).sum(**ROLLING_KW)
 
 
-def atr(high: pd.Series, low: pd.Series, close: pd.Series, period: int) -> pd.Series:
+def atr(high: pd.Series, low: pd.Series, close: pd.Series, period: int,
+        return_numpy: bool = False) -> Union[pd.Series, np.ndarray]:
     """Average True Range"""
-    tr1 = high - low
-    tr2 = abs(high - close.shift())
-    tr3 = abs(low - close.shift())
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-    return tr.rolling(window=period).mean()
+    h = np.asarray(high, dtype=np.float64)
+    l = np.asarray(low, dtype=np.float64)
+    c = np.asarray(close, dtype=np.float64)
+    c_prev = np.empty_like(c)
+    c_prev[0] = np.nan
+    c_prev[1:] = c[:-1]
+    # fmax ignores the NaN from the first shifted close, matching the
+    # old concat(...).max(axis=1) skipna behaviour
+    tr = np.fmax(h - l, np.fmax(np.abs(h - c_prev), np.abs(l - c_prev)))
+    out = np.empty_like(tr)
+    _rolling_mean(tr, period, out)
+    return _output(out, getattr(close, 'index', None), return_numpy)
 
 
-def bollinger_bands(series: pd.Series, period: int, num_std: float = 2) -> Tuple[pd.Series, pd.Series, pd.Series]:
+def bollinger_bands(series: pd.Series, period: int, num_std: float = 2,
+                    return_numpy: bool = False) -> Tuple:
     """Bollinger Bands (middle, upper, lower)"""
-    middle = sma(series, period)
-    std = series.rolling(window=period).std()
-    upper = middle + (std * num_std)
-    lower = middle - (std * num_std)
-    return middle, upper, lower
+    x = np.asarray(series, dtype=np.float64)
+    out_mid = np.empty_like(x)
+    out_upper = np.empty_like(x)
+    out_lower = np.empty_like(x)
+    _bbands_loop(x, period, float(num_std), out_mid, out_upper, out_lower)
+    index = getattr(series, 'index', None)
+    return (
+        _output(out_mid, index, return_numpy),
+        _output(out_upper, index, return_numpy),
+        _output(out_lower, index, return_numpy)
+    )
 
 
 def realized_volatility(returns: pd.Series, period: int) -> pd.Series:
@@ -52,29 +322,44 @@ def realized_volatility(returns: pd.Series, period: int) -> pd.Series:
     return returns.rolling(window=period).std() * np.sqrt(252)  # Annualized
 
 
-def rsi(series: pd.Series, period: int) -> pd.Series:
-    """Relative Strength Index"""
-    delta = series.diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-    rs = gain / loss
-    return 100 - (100 / (1 + rs))
+def rsi(series: pd.Series, period: int, return_numpy: bool = False) -> Union[pd.Series, np.ndarray]:
+    """Relative Strength Index (Wilder smoothing)"""
+    x = np.asarray(series, dtype=np.float64)
+    delta = np.diff(x, prepend=np.nan)
+    out = np.empty(len(delta), dtype=np.float64)
+    _rsi_loop(delta, period, out)
+    return _output(out, getattr(series, 'index', None), return_numpy)
 
 
-def macd(series: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[pd.Series, pd.Series, pd.Series]:
+def macd(series: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9,
+         return_numpy: bool = False) -> Tuple:
     """MACD (macd line, signal line, histogram)"""
-    ema_fast = ema(series, fast)
-    ema_slow = ema(series, slow)
-    macd_line = ema_fast - ema_slow
-    signal_line = ema(macd_line, signal)
-    histogram = macd_line - signal_line
-    return macd_line, signal_line, histogram
+    x = np.asarray(series, dtype=np.float64)
+    out_fast = np.empty_like(x)
+    out_slow = np.empty_like(x)
+    # Both price EMAs in one pass over the array
+    _dual_ema(x, 2.0 / (fast + 1), 2.0 / (slow + 1), out_fast, out_slow)
+    macd_arr = out_fast - out_slow
+    signal_arr = np.empty_like(macd_arr)
+    _ema_loop(macd_arr, 2.0 / (signal + 1), signal_arr)
+
+    index = getattr(series, 'index', None)
+    return (
+        _output(macd_arr, index, return_numpy),
+        _output(signal_arr, index, return_numpy),
+        _output(macd_arr - signal_arr, index, return_numpy)
+    )
 
 
 def stochastic(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14, smooth_k: int = 3, smooth_d: int = 3) -> Tuple[pd.Series, pd.Series]:
     """Stochastic Oscillator (%K, %D)"""
-    lowest_low = low.rolling(window=period).min()
-    highest_high = high.rolling(window=period).max()
+    l = low.to_numpy(dtype=np.float64)
+    h = high.to_numpy(dtype=np.float64)
+    lowest_low = np.empty_like(l)
+    highest_high = np.empty_like(h)
+    _roll_min_max(l, h, period, lowest_low, highest_high)
+    lowest_low = pd.Series(lowest_low, index=low.index)
+    highest_high = pd.Series(highest_high, index=high.index)
     k_percent = 100 * ((close - lowest_low) / (highest_high - lowest_low))
     k_percent = sma(k_percent, smooth_k)
     d_percent = sma(k_percent, smooth_d)
@@ -83,12 +368,23 @@ def stochastic(high: pd.Series, low: pd.Series, close: pd.Series, period: int =
 
 def obv(close: pd.Series, volume: pd.Series) -> pd.Series:
     """On Balance Volume"""
-    return (np.sign(close.diff()) * volume).fillna(0).cumsum()
+    out = np.empty(len(close), dtype=np.float64)
+    _obv_loop(close.to_numpy(dtype=np.float64), volume.to_numpy(dtype=np.float64), out)
+    return pd.Series(out, index=close.index)
 
 
 def volume_profile(price: pd.Series, volume: pd.Series, bins: int = 20) -> dict:
     """Volume Profile"""
-    price_bins = pd.cut(price, bins=bins)
-    volume_by_price = volume.groupby(price_bins).sum()
-    poc = volume_by_price.idxmax()  # Point of Control
-    return {'profile': volume_by_price, 'poc': poc.mid}
+    # One weighted-histogram pass instead of pd.cut + groupby; rows
+    # with a non-finite price or volume are excluded, as pd.cut did
+    p = price.to_numpy(dtype=np.float64)
+    v = volume.to_numpy(dtype=np.float64)
+    valid = np.isfinite(p) & np.isfinite(v)
+    if not valid.all():
+        p = p[valid]
+        v = v[valid]
+    sums, edges = np.histogram(p, bins=bins, weights=v)
+    poc_idx = sums.argmax()  # Point of Control
+    poc = 0.5 * (edges[poc_idx] + edges[poc_idx + 1])
+    profile = pd.Series(sums, index=pd.IntervalIndex.from_breaks(edges))
+    return {'profile': profile, 'poc': poc}
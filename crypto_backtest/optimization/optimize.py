@@ -7,6 +7,7 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Callable, Any, Tuple
 from ..api.backtest import run_backtest
+from ..features import warmup
 
 
 def optimize_strategy(
@@ -15,29 +16,34 @@ def optimize_strategy(
     param_space: Dict[str, Tuple[float, float]],
     metric: str = 'sharpe_ratio',
     n_trials: int = 100,
-    n_jobs: int = 1,
+    n_jobs: int = -1,
     initial_capital: float = 10000,
     commission: float = 0.001,
-    verbose: bool = False
+    verbose: bool = False,
+    sampler: Any = None
 ) -> Dict[str, Any]:
     """
     Optimize strategy parameters using Optuna
-    
+
     Args:
         data: Market data
         strategy: Strategy function
         param_space: Parameter search space
         metric: Metric to optimize
         n_trials: Number of optimization trials
-        n_jobs: Number of parallel jobs
+        n_jobs: Number of parallel jobs (-1 uses all CPUs)
         initial_capital: Starting capital
         commission: Trading commission
         verbose: Show optimization progress
-    
+        sampler: Optional Optuna sampler to reuse across studies
+
     Returns:
         Best parameters and optimization history
     """
-    
+    # Warm numba's disk cache once so parallel trials don't each pay
+    # kernel compile time
+    warmup()
+
     def objective(trial):
         # Sample parameters
         params = {}
@@ -66,7 +72,7 @@ def optimize_strategy(
             return -float('inf')
     
     # Create study
-    study = optuna.create_study(direction='maximize')
+    study = optuna.create_study(direction='maximize', sampler=sampler)
     study.optimize(objective, n_trials=n_trials, n_jobs=n_jobs, show_progress_bar=verbose)
     
     # Get best parameters
@@ -99,11 +105,12 @@ def walk_forward_analysis(
     test_periods: int = 63,
     step_size: int = 21,
     metric: str = 'sharpe_ratio',
-    n_trials: int = 50
+    n_trials: int = 50,
+    seed: int = None
 ) -> pd.DataFrame:
     """
     Walk-forward optimization analysis
-    
+
     Args:
         data: Market data
         strategy: Strategy function
@@ -113,49 +120,56 @@ def walk_forward_analysis(
         step_size: Step size for rolling window
         metric: Metric to optimize
         n_trials: Trials per optimization window
-    
+        seed: Optional seed for the shared TPE sampler
+
     Returns:
         DataFrame with walk-forward results
     """
-    # Get timestamps from data
-    all_timestamps = set()
-    for symbol_data in data.values():
-        if 'ohlcv' in symbol_data:
-            all_timestamps.update(symbol_data['ohlcv'].index)
-    timestamps = sorted(list(all_timestamps))
-    
-    results = []
-    
-    # Rolling window optimization
+    # Unified timestamp grid: one sorted-unique pass over raw index
+    # arrays instead of a Python set union
+    index_arrays = [
+        symbol_data['ohlcv'].index.values
+        for symbol_data in data.values() if 'ohlcv' in symbol_data
+    ]
+    timestamps = np.unique(np.concatenate(index_arrays)) if index_arrays else np.array([], dtype='datetime64[ns]')
+
+    # One sampler shared across every window's study, so warm-up state
+    # is not rebuilt per window
+    sampler = optuna.samplers.TPESampler(seed=seed)
+
+    # Pre-slice every window up front; the loop then only runs
+    # optimize/backtest, no per-window dict rebuilding
+    windows = []
     for i in range(0, len(timestamps) - train_periods - test_periods, step_size):
         train_start = i
         train_end = i + train_periods
         test_start = train_end
         test_end = test_start + test_periods
-        
+
         if test_end >= len(timestamps):
             break
-        
-        # Filter data for train period
-        train_data = {}
-        for symbol, symbol_data in data.items():
-            train_data[symbol] = {
-                'ohlcv': symbol_data['ohlcv'].iloc[train_start:train_end]
-            }
-        
+
+        train_data = {
+            symbol: {'ohlcv': symbol_data['ohlcv'].iloc[train_start:train_end]}
+            for symbol, symbol_data in data.items()
+        }
+        test_data = {
+            symbol: {'ohlcv': symbol_data['ohlcv'].iloc[test_start:test_end]}
+            for symbol, symbol_data in data.items()
+        }
+        windows.append((train_start, train_end, test_start, test_end, train_data, test_data))
+
+    results = []
+
+    for train_start, train_end, test_start, test_end, train_data, test_data in windows:
         # Optimize on training data
         opt_results = optimize_strategy(
             train_data, strategy, param_space,
-            metric=metric, n_trials=n_trials, verbose=False
+            metric=metric, n_trials=n_trials, verbose=False,
+            sampler=sampler
         )
-        
+
         # Test on out-of-sample data
-        test_data = {}
-        for symbol, symbol_data in data.items():
-            test_data[symbol] = {
-                'ohlcv': symbol_data['ohlcv'].iloc[test_start:test_end]
-            }
-        
         test_results = run_backtest(
             test_data, strategy,
             params=opt_results['best_params'],
@@ -0,0 +1,80 @@
+"""
+Tests for the core backtesting engine
+"""
+
+import numpy as np
+import pandas as pd
+
+from crypto_backtest.core.engine import BacktestEngine
+
+
+def _make_bars(n_bars=200, n_symbols=2, seed=42):
+    """Random-walk OHLCV tensor plus the equivalent per-symbol dict"""
+    rng = np.random.default_rng(seed)
+    timestamps = pd.date_range('2024-01-01', periods=n_bars, freq='h')
+    symbols = [f'SYM{i}/USDT' for i in range(n_symbols)]
+
+    bars = np.empty((n_bars, n_symbols, 5), dtype=np.float64)
+    for j in range(n_symbols):
+        close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, n_bars)))
+        bars[:, j, 0] = close
+        bars[:, j, 1] = close * 1.005
+        bars[:, j, 2] = close * 0.995
+        bars[:, j, 3] = close
+        bars[:, j, 4] = rng.uniform(100, 1000, n_bars)
+
+    columns = ['open', 'high', 'low', 'close', 'volume']
+    data = {
+        symbol: {'ohlcv': pd.DataFrame(bars[:, j, :], index=timestamps, columns=columns)}
+        for j, symbol in enumerate(symbols)
+    }
+    return bars, symbols, timestamps, data
+
+
+def _ma_cross(data, positions, timestamp):
+    """Minimal moving-average cross over the first symbol"""
+    close = data['SYM0/USDT']['ohlcv']['close']
+    if len(close) < 20:
+        return []
+    fast = close.iloc[-5:].mean()
+    slow = close.iloc[-20:].mean()
+    if fast > slow and positions.get('SYM0/USDT', 0) == 0:
+        return [{'symbol': 'SYM0/USDT', 'side': 'buy', 'size': 0.1}]
+    if fast < slow and positions.get('SYM0/USDT', 0) > 0:
+        return 'close_all'
+    return []
+
+
+def test_from_aligned_matches_dict_constructor():
+    """from_aligned and the dict constructor produce identical results"""
+    bars, symbols, timestamps, data = _make_bars()
+
+    engine_dict = BacktestEngine(data, initial_capital=10000, verbose=False)
+    results_dict = engine_dict.run(_ma_cross)
+
+    engine_aligned = BacktestEngine.from_aligned(
+        bars, symbols, timestamps, initial_capital=10000, verbose=False
+    )
+    results_aligned = engine_aligned.run(_ma_cross)
+
+    pd.testing.assert_series_equal(
+        results_dict['equity_curve'], results_aligned['equity_curve']
+    )
+    pd.testing.assert_frame_equal(
+        results_dict['trades'], results_aligned['trades']
+    )
+    assert results_dict['final_capital'] == results_aligned['final_capital']
+    assert len(results_dict['trades']) > 0
+
+
+def test_safe_mode_swallows_strategy_errors():
+    """safe_mode=True keeps running past a raising strategy"""
+    _, _, _, data = _make_bars(n_bars=50)
+
+    def broken(data, positions, timestamp):
+        raise RuntimeError('boom')
+
+    engine = BacktestEngine(data, initial_capital=10000, verbose=False)
+    results = engine.run(broken, safe_mode=True)
+    assert len(results['trades']) == 0
+    assert results['final_capital'] == 10000
@@ -0,0 +1,79 @@
+"""
+Tests for the columnar event buffer
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from crypto_backtest.core.events import (
+    EventBuffer, EventType, FillEvent, SIDE_BUY, SIDE_SELL
+)
+from crypto_backtest.core.portfolio import Portfolio
+
+
+def test_add_fill_and_column_views():
+    """Appended fills land in the parallel column arrays"""
+    buf = EventBuffer()
+    ts = pd.Timestamp('2024-01-01 00:00:00')
+    buf.add_fill(ts, 'BTC/USDT', 'buy', 0.5, 50000.0, 25.0, 1.0)
+    buf.add_fill(ts + pd.Timedelta(hours=1), 'ETH/USDT', 'sell', 2.0, 3000.0, 6.0, 0.5)
+
+    assert len(buf) == 2
+    assert buf.symbol_names == ['BTC/USDT', 'ETH/USDT']
+    assert list(buf.symbol_ids) == [0, 1]
+    assert list(buf.sides) == [SIDE_BUY, SIDE_SELL]
+    np.testing.assert_allclose(buf.sizes, [0.5, 2.0])
+    np.testing.assert_allclose(buf.prices, [50000.0, 3000.0])
+    np.testing.assert_allclose(buf.commissions, [25.0, 6.0])
+    np.testing.assert_allclose(buf.slippages, [1.0, 0.5])
+
+
+def test_buffer_grows_past_initial_capacity():
+    """Appending beyond the initial capacity preserves earlier rows"""
+    buf = EventBuffer()
+    n = EventBuffer._INITIAL_CAPACITY * 2 + 3
+    ts = pd.Timestamp('2024-01-01')
+    for i in range(n):
+        buf.add_fill(ts + pd.Timedelta(minutes=i), 'BTC/USDT', 'buy', float(i), 100.0 + i)
+
+    assert len(buf) == n
+    np.testing.assert_allclose(buf.sizes, np.arange(n, dtype=np.float64))
+    np.testing.assert_allclose(buf.prices, 100.0 + np.arange(n, dtype=np.float64))
+    assert buf.timestamps[-1] == np.datetime64(ts + pd.Timedelta(minutes=n - 1))
+
+
+def test_fill_at_materializes_a_fill_event():
+    """fill_at returns a FillEvent view of one buffer row"""
+    buf = EventBuffer()
+    ts = pd.Timestamp('2024-03-05 12:00:00')
+    buf.add_fill(ts, 'BTC/USDT', 'sell', 1.5, 42000.0, 63.0, 2.0)
+
+    fill = buf.fill_at(0)
+    assert isinstance(fill, FillEvent)
+    assert fill.type == EventType.FILL
+    assert fill.timestamp == ts
+    assert fill.symbol == 'BTC/USDT'
+    assert fill.side == 'sell'
+    assert fill.size == 1.5
+    assert fill.price == 42000.0
+    assert fill.commission == 63.0
+    assert fill.slippage == 2.0
+
+    with pytest.raises(IndexError):
+        buf.fill_at(1)
+
+
+def test_portfolio_trade_log_flows_through_buffer():
+    """record_trade appends to the shared buffer and trades_frame reads it back"""
+    portfolio = Portfolio(10000)
+    ts = pd.Timestamp('2024-01-01')
+    portfolio.record_trade('BTC/USDT', 'buy', 0.5, 100.0, 0.1, ts)
+    portfolio.record_trade('BTC/USDT', 'sell', 0.5, 110.0, 0.1, ts + pd.Timedelta(hours=1))
+
+    trades = portfolio.trades_frame()
+    assert len(trades) == 2
+    assert list(trades['symbol']) == ['BTC/USDT', 'BTC/USDT']
+    assert list(trades['side']) == ['buy', 'sell']
+    np.testing.assert_allclose(trades['size'], [0.5, 0.5])
+    np.testing.assert_allclose(trades['value'], [50.0, 55.0])
@@ -0,0 +1,83 @@
+"""
+Tests for the JIT feature kernels, focused on NaN inputs
+"""
+
+import numpy as np
+import pandas as pd
+
+from crypto_backtest.features.technical import (
+    sma, ema, rsi, macd, atr, bollinger_bands
+)
+
+
+def _random_close(n=200, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.Series(rng.standard_normal(n).cumsum() + 100.0)
+
+
+def test_sma_raw_path_recovers_after_nan():
+    """The return_numpy kernel matches pandas rolling mean around a NaN"""
+    close = _random_close()
+    close.iloc[50] = np.nan
+    got = sma(close, 10, return_numpy=True)
+    ref = close.rolling(10).mean().to_numpy()
+    np.testing.assert_allclose(got, ref, atol=1e-10, equal_nan=True)
+
+
+def test_atr_recovers_after_nan_bar():
+    """One NaN bar blanks only the windows that contain it"""
+    close = _random_close()
+    close.iloc[50] = np.nan  # one fully missing bar
+    high = close + 0.5
+    low = close - 0.5
+    result = atr(high, low, close, 10)
+    assert np.isnan(result.iloc[55])
+    assert np.isfinite(result.iloc[70:]).all()
+
+
+def test_bollinger_bands_on_pct_change():
+    """The leading pct_change NaN does not blank the whole series"""
+    returns = _random_close().pct_change()
+    mid, upper, lower = bollinger_bands(returns, 20)
+    ref_mean = returns.rolling(20).mean()
+    ref_std = returns.rolling(20).std()
+    np.testing.assert_allclose(mid, ref_mean, atol=1e-10, equal_nan=True)
+    np.testing.assert_allclose(upper, ref_mean + 2 * ref_std, atol=1e-10, equal_nan=True)
+    np.testing.assert_allclose(lower, ref_mean - 2 * ref_std, atol=1e-10, equal_nan=True)
+    assert np.isfinite(mid.iloc[-1])
+
+
+def test_rsi_survives_nan_in_seed_window():
+    """A NaN delta inside the seed window must not pin RSI at 100"""
+    close = pd.Series([1.0, 2.0, 1.5, np.nan, 2.5, 2.0, 3.0, 2.8, 3.5, 3.1, 4.0, 3.9])
+    result = rsi(close, 3)
+    tail = result.iloc[4:]
+    assert np.isfinite(tail).all()
+    assert ((tail >= 0) & (tail <= 100)).all()
+    assert tail.nunique() > 1
+
+
+def test_ema_matches_pandas_across_nan():
+    """The EMA kernel carries forward across NaN like pandas ewm"""
+    series = pd.Series([0.0, 1.0, np.nan, 2.0, 1.0, 1.5])
+    for span in (2, 5, 9):
+        got = ema(series, span, return_numpy=True)
+        ref = series.ewm(span=span, adjust=False).mean().to_numpy()
+        np.testing.assert_allclose(got, ref, atol=1e-12, equal_nan=True)
+
+
+def test_macd_recovers_after_interior_nan():
+    """macd on a series with one interior NaN matches the ewm chain"""
+    close = _random_close(300, seed=14)
+    close.iloc[100] = np.nan
+    macd_line, signal_line, histogram = macd(close)
+
+    ema_fast = close.ewm(span=12, adjust=False).mean()
+    ema_slow = close.ewm(span=26, adjust=False).mean()
+    ref_macd = ema_fast - ema_slow
+    ref_signal = ref_macd.ewm(span=9, adjust=False).mean()
+
+    np.testing.assert_allclose(macd_line, ref_macd, atol=1e-10, equal_nan=True)
+    np.testing.assert_allclose(signal_line, ref_signal, atol=1e-10, equal_nan=True)
+    np.testing.assert_allclose(histogram, ref_macd - ref_signal, atol=1e-10, equal_nan=True)
+    assert np.isfinite(macd_line.iloc[-1])